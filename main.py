@@ -21,10 +21,10 @@ Layout
   └──────────────────────────────────┘
 """
 
+import math
 import time
-import threading
 import tkinter as tk
-from tkinter import font as tkfont, messagebox
+from tkinter import font as tkfont
 
 
 # ── colour palette ─────────────────────────────────────────────────────────────
@@ -38,6 +38,25 @@ SUBTEXT = "#6c7086"     # muted text / inactive dots
 DOT_ON = ACCENT2
 DOT_OFF = SURFACE
 
+# ── progress dot geometry ──────────────────────────────────────────────────────
+DOT_COUNT = 10
+DOT_SIZE = 14           # diameter in px
+DOT_GAP = 8             # horizontal space between dots
+
+# ── display string cache ───────────────────────────────────────────────────────
+FMT_CACHE_MAX = 3600    # precompute HH : MM : SS labels only for timers ≤ 1 h
+
+# ── shared widget options ──────────────────────────────────────────────────────
+SPIN_KW = dict(
+    bg=SURFACE, fg=TEXT,
+    buttonbackground=SURFACE,
+    relief="flat",
+    highlightthickness=0,
+    insertbackground=TEXT,
+    format="%02.0f",
+    wrap=True,
+)
+
 
 class CountdownTimer(tk.Tk):
     """Main application window."""
@@ -50,19 +69,26 @@ class CountdownTimer(tk.Tk):
         self.configure(bg=BG)
         self.resizable(False, False)
 
-        # centre on screen
-        self.update_idletasks()
+        # centre on screen (screen metrics need no idle-task flush)
         w, h = 420, 480
-        x = (self.winfo_screenwidth() - w) // 2
-        y = (self.winfo_screenheight() - h) // 2
+        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+        x = (sw - w) // 2
+        y = (sh - h) // 2
         self.geometry(f"{w}x{h}+{x}+{y}")
 
         # ── state ──────────────────────────────────────────────────────────────
         self._total_seconds = 0       # original duration (for progress dots)
-        self._remaining = 0           # seconds left
+        self._remaining = 0           # seconds left; fractional while paused
+        self._end = 0.0               # monotonic deadline while running
+        self._fmt_cache: tuple[str, ...] = ()  # HH : MM : SS per second left
         self._running = False
-        self._thread: threading.Thread | None = None
+        self._after_id: str | None = None  # pending tick callback
         self._dot_phase = 0           # cycles the dot animation
+        self._last_lit = -1           # dots lit on last render
+        self._last_text = ""          # display text on last render
+        self._last_fg = None          # display colour on last render
+        self._last_hurry = None       # seconds shown in the "Hurry!" status
+        self._hurry_msgs = tuple(f"Hurry! {i}s left" for i in range(11))
 
         # ── fonts ──────────────────────────────────────────────────────────────
         self._f_title = tkfont.Font(family="Segoe UI", size=18, weight="bold")
@@ -72,8 +98,12 @@ class CountdownTimer(tk.Tk):
         self._f_btn = tkfont.Font(family="Segoe UI", size=11, weight="bold")
         self._f_msg = tkfont.Font(family="Segoe UI", size=11)
 
+        # build while hidden so Tk doesn't repaint intermediate states
+        self.withdraw()
         self._build_ui()
+        self._build_done_dialog()
         self._reset_display()
+        self.deiconify()
 
     # ── UI construction ────────────────────────────────────────────────────────
     def _build_ui(self):
@@ -107,13 +137,7 @@ class CountdownTimer(tk.Tk):
                 from_=0, to=(23 if label == "HH" else 59),
                 textvariable=var, width=3,
                 font=self._f_spin,
-                bg=SURFACE, fg=TEXT,
-                buttonbackground=SURFACE,
-                relief="flat",
-                highlightthickness=0,
-                insertbackground=TEXT,
-                format="%02.0f",
-                wrap=True,
+                **SPIN_KW,
             )
             sb.grid(row=1, column=row_col, padx=4)
 
@@ -139,15 +163,17 @@ class CountdownTimer(tk.Tk):
         self._btn_reset.grid(row=0, column=1, padx=10)
 
         # ── big time display ───────────────────────────────────────────────────
+        self._var_display = tk.StringVar(value="00 : 00 : 00")
         self._lbl_display = tk.Label(
-            self, text="00 : 00 : 00",
+            self, textvariable=self._var_display,
             font=self._f_display, bg=BG, fg=TEXT,
         )
         self._lbl_display.pack(pady=(16, 4))
 
         # ── status message ─────────────────────────────────────────────────────
+        self._var_status = tk.StringVar(value="Set a time and press Start")
         self._lbl_status = tk.Label(
-            self, text="Set a time and press Start",
+            self, textvariable=self._var_status,
             font=self._f_msg, bg=BG, fg=SUBTEXT,
         )
         self._lbl_status.pack()
@@ -155,12 +181,52 @@ class CountdownTimer(tk.Tk):
         # ── progress dots ──────────────────────────────────────────────────────
         dot_frame = tk.Frame(self, bg=BG)
         dot_frame.pack(pady=(18, 0))
-        self._dots: list[tk.Label] = []
-        for _ in range(10):
-            d = tk.Label(dot_frame, text="●", font=("Segoe UI", 14),
-                         bg=BG, fg=DOT_OFF)
-            d.pack(side="left", padx=3)
-            self._dots.append(d)
+        step = DOT_SIZE + DOT_GAP
+        self._dot_canvas = tk.Canvas(
+            dot_frame,
+            width=DOT_COUNT * step - DOT_GAP, height=20,
+            bg=BG, highlightthickness=0,
+        )
+        self._dot_canvas.pack()
+        y0 = (20 - DOT_SIZE) // 2
+        self._dot_ids = tuple(
+            self._dot_canvas.create_oval(
+                i * step, y0, i * step + DOT_SIZE, y0 + DOT_SIZE,
+                fill=DOT_OFF, outline="",
+            )
+            for i in range(DOT_COUNT)
+        )
+
+    def _build_done_dialog(self):
+        """Create the "finished" popup once; it is only shown/hidden later."""
+        dlg = tk.Toplevel(self, bg=BG, padx=24, pady=18)
+        dlg.withdraw()
+        dlg.title("Done")
+        dlg.resizable(False, False)
+        dlg.transient(self)
+        dlg.protocol("WM_DELETE_WINDOW", dlg.withdraw)
+        dlg.bind("<Return>", lambda _e: dlg.withdraw())
+        dlg.bind("<Escape>", lambda _e: dlg.withdraw())
+
+        tk.Label(
+            dlg, text="⏱ Your countdown has finished!",
+            font=self._f_msg, bg=BG, fg=TEXT,
+        ).pack(pady=(0, 14))
+        self._btn_done = self._make_button(dlg, "OK", ACCENT, dlg.withdraw)
+        self._btn_done.pack()
+
+        self._done_dialog = dlg
+
+    def _show_done_dialog(self):
+        """Centre the finished popup over the main window and focus OK."""
+        dlg = self._done_dialog
+        dlg.update_idletasks()
+        x = self.winfo_rootx() + (self.winfo_width() - dlg.winfo_reqwidth()) // 2
+        y = self.winfo_rooty() + (self.winfo_height() - dlg.winfo_reqheight()) // 2
+        dlg.geometry(f"+{x}+{y}")
+        dlg.deiconify()
+        dlg.lift()
+        self._btn_done.focus_force()
 
     # ── helpers ────────────────────────────────────────────────────────────────
     def _make_button(self, parent, text, color, command):
@@ -176,13 +242,13 @@ class CountdownTimer(tk.Tk):
     @staticmethod
     def _parse_time(h_str, m_str, s_str) -> int:
         """Return total seconds from three string spinbox values."""
-        try:
-            h = max(0, min(int(h_str or 0), 23))
-            m = max(0, min(int(m_str or 0), 59))
-            s = max(0, min(int(s_str or 0), 59))
-        except ValueError:
-            return 0
-        return h * 3600 + m * 60 + s
+        def part(text, hi):
+            text = text.strip() or "0"
+            if not text.isdecimal():   # junk typed into a spinbox
+                return 0
+            return min(int(text), hi)
+
+        return part(h_str, 23) * 3600 + part(m_str, 59) * 60 + part(s_str, 59)
 
     @staticmethod
     def _fmt(total: int) -> str:
@@ -191,29 +257,48 @@ class CountdownTimer(tk.Tk):
         m, s = divmod(rem, 60)
         return f"{h:02d} : {m:02d} : {s:02d}"
 
-    # ── display / UI update helpers (always called from main thread) ───────────
+    # ── display / UI update helpers ────────────────────────────────────────────
     def _reset_display(self):
-        self._lbl_display.config(text="00 : 00 : 00", fg=TEXT)
-        self._lbl_status.config(text="Set a time and press Start", fg=SUBTEXT)
+        self._var_display.set("00 : 00 : 00")
+        self._lbl_display.config(fg=TEXT)
+        self._last_text, self._last_fg = "00 : 00 : 00", TEXT
+        self._var_status.set("Set a time and press Start")
+        self._lbl_status.config(fg=SUBTEXT)
         self._btn_start.config(text="▶  Start", bg=ACCENT)
         self._update_dots(0, 0)
 
-    def _update_dots(self, remaining: int, total: int):
+    def _update_dots(self, remaining: int, total: int, *,
+                     _on=DOT_ON, _off=DOT_OFF, _count=DOT_COUNT):
         """Light up dots proportional to remaining / total time."""
         if total == 0:
             lit = 0
         else:
-            lit = round((remaining / total) * len(self._dots))
-        for i, dot in enumerate(self._dots):
-            dot.config(fg=DOT_ON if i < lit else DOT_OFF)
+            lit = round((remaining / total) * _count)
+        if lit == self._last_lit:
+            return
+        self._last_lit = lit
+        ids = self._dot_ids
+        itemconfigure = self._dot_canvas.itemconfigure
+        for item in ids[:lit]:
+            itemconfigure(item, fill=_on)
+        for item in ids[lit:]:
+            itemconfigure(item, fill=_off)
 
     # ── event handlers ─────────────────────────────────────────────────────────
     def _on_start_pause(self):
         if self._running:
+            self._cancel_tick()
+            left = self._end - time.monotonic()
+            if left <= 0:
+                # deadline passed before the pending tick ran – finish, don't pause
+                self._tick()
+                return
             # pause
             self._running = False
+            self._remaining = left
             self._btn_start.config(text="▶  Resume", bg=ACCENT)
-            self._lbl_status.config(text="Paused", fg=ACCENT)
+            self._var_status.set("Paused")
+            self._lbl_status.config(fg=ACCENT)
         else:
             if self._remaining == 0:
                 # fresh start – read spinboxes
@@ -221,6 +306,7 @@ class CountdownTimer(tk.Tk):
                     self._var_h.get(), self._var_m.get(), self._var_s.get()
                 )
                 if total == 0:
+                    from tkinter import messagebox  # rarely needed; load lazily
                     messagebox.showwarning(
                         "No time set",
                         "Please enter hours, minutes, or seconds greater than zero."
@@ -228,53 +314,81 @@ class CountdownTimer(tk.Tk):
                     return
                 self._total_seconds = total
                 self._remaining = total
+                self._fmt_cache = (
+                    tuple(self._fmt(s) for s in range(total + 1))
+                    if total <= FMT_CACHE_MAX else ()
+                )
 
             # start / resume
             self._running = True
             self._btn_start.config(text="⏸  Pause", bg=ACCENT2)
-            self._lbl_status.config(text="Running…", fg=ACCENT2)
-            self._lbl_display.config(fg=TEXT)
-            self._thread = threading.Thread(target=self._tick, daemon=True)
-            self._thread.start()
+            self._var_status.set("Running…")
+            self._lbl_status.config(fg=ACCENT2)
+            self._last_hurry = None
+            self._end = time.monotonic() + self._remaining
+            self._tick()
 
     def _on_reset(self):
+        self._cancel_tick()
         self._running = False
         self._remaining = 0
         self._total_seconds = 0
+        self._fmt_cache = ()
         self._var_h.set("00")
         self._var_m.set("00")
         self._var_s.set("00")
         self._reset_display()
 
-    # ── countdown logic (runs in background thread) ────────────────────────────
+    # ── countdown logic (scheduled on the Tk event loop) ───────────────────────
+    def _cancel_tick(self):
+        """Drop the pending tick, if any, so pause/reset take effect at once."""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
     def _tick(self):
-        while self._running and self._remaining > 0:
-            # schedule a UI refresh on the main thread
-            self.after(0, self._refresh_ui, self._remaining)
-            time.sleep(1)
-            if self._running:          # might have been paused mid-sleep
-                self._remaining -= 1
-
-        if self._running:              # finished naturally (not paused/reset)
+        left = self._end - time.monotonic()
+        secs = max(0, math.ceil(left))
+        if secs > 0:
+            self._refresh_ui(secs)
+            # wake just past the next whole-second boundary, not a fixed 1 s,
+            # so scheduling jitter never accumulates into drift
+            self._after_id = self.after(math.ceil(left % 1 * 1000) + 1, self._tick)
+        else:                          # finished naturally (not paused/reset)
+            self._after_id = None
+            self._remaining = 0
             self._running = False
-            self.after(0, self._on_finished)
-
-    def _refresh_ui(self, remaining: int):
-        """Called on the main thread to update display labels and dots."""
-        self._lbl_display.config(text=self._fmt(remaining))
+            self._on_finished()
+
+    def _refresh_ui(self, remaining: int, *, _urgent=ACCENT3, _text=TEXT):
+        """Update display labels and dots for *remaining* seconds."""
+        cache = self._fmt_cache
+        txt = cache[remaining] if remaining < len(cache) else self._fmt(remaining)
+        if txt != self._last_text:
+            self._var_display.set(txt)
+            self._last_text = txt
         self._update_dots(remaining, self._total_seconds)
 
         # turn display red in the last 10 seconds
-        if remaining <= 10:
-            self._lbl_display.config(fg=ACCENT3)
-            self._lbl_status.config(text=f"Hurry! {remaining}s left", fg=ACCENT3)
+        fg = _urgent if remaining <= 10 else _text
+        if fg != self._last_fg:            # only when the colour flips
+            self._lbl_display.config(fg=fg)
+            self._last_fg = fg
+        if remaining <= 10 and remaining != self._last_hurry:
+            if self._last_hurry is None:   # entering the urgent phase
+                self._lbl_status.config(fg=_urgent)
+            self._var_status.set(self._hurry_msgs[remaining])
+            self._last_hurry = remaining
 
     def _on_finished(self):
-        self._lbl_display.config(text="00 : 00 : 00", fg=ACCENT2)
-        self._lbl_status.config(text="✓  Timer completed!", fg=ACCENT2)
+        self._var_display.set("00 : 00 : 00")
+        self._lbl_display.config(fg=ACCENT2)
+        self._last_text, self._last_fg = "00 : 00 : 00", ACCENT2
+        self._var_status.set("✓  Timer completed!")
+        self._lbl_status.config(fg=ACCENT2)
         self._btn_start.config(text="▶  Start", bg=ACCENT)
         self._update_dots(0, 0)
-        messagebox.showinfo("Done", "⏱ Your countdown has finished!")
+        self._show_done_dialog()
 
 
 # ── entry point ────────────────────────────────────────────────────────────────